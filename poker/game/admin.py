@@ -94,6 +94,7 @@ class ProfileAdmin(admin.ModelAdmin):
 
     readonly_fields = READONLY_FIELDS
     list_display = ("user", "chips", "games_played", "games_won")
+    list_select_related = ("user",)
 
 
 @admin.register(Game)
@@ -114,6 +115,8 @@ class GameAdmin(admin.ModelAdmin):
     list_filter = ("game_type", "betting_type", "status")
     search_fields = ("name",)
     ordering = ("-created_at",)
+    list_per_page = 50
+    show_full_result_count = False
 
     def get_fields(self, request, obj=None):
         """
@@ -145,8 +148,11 @@ class PlayerAdmin(admin.ModelAdmin):
     """
 
     list_display = ("user", "game", "chips", "last_active")
+    list_select_related = ("user", "game")
     list_filter = ("game", "user")
     search_fields = ("user__username", "game__name")
+    list_per_page = 50
+    show_full_result_count = False
     actions = ["remove_from_game", "remove_inactive_players"]
 
     def remove_from_game(self, request, queryset):
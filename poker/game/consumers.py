@@ -1,22 +1,128 @@
-import json
-import redis
+import logging
+import orjson
+import redis.asyncio as aioredis
 import random
 import asyncio
+import weakref
 from channels.generic.websocket import AsyncWebsocketConsumer
 from django.conf import settings
 from django.db import transaction
+from django.db.models import F
 from asgiref.sync import sync_to_async
 from treys import Card
 # from itertools import combinations
 # from typing import List, Tuple
 from collections import defaultdict
-from .models import Game, Player, User
+from .models import Game, Player, Profile, User
 from .utils import get_next_phase, find_best_five_cards, convert_treys_str_int_pretty, can_user_do_action, create_deck
 
-# Connect to Redis
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True
+logger = logging.getLogger(__name__)
+
+# Connect to Redis (asyncio client, so Redis I/O never blocks the event loop).
+# All consumers share one bounded pool; idle connections are health-checked
+# before reuse so a dropped socket doesn't fail the next write.
+redis_pool = aioredis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=0,
+    decode_responses=True,
+    max_connections=32,
+    health_check_interval=30,
 )
+redis_client = aioredis.Redis(connection_pool=redis_pool)
+
+# Messages are stored in Redis in the background; keep a reference to each
+# pending write until it completes, and a lock per room so they land in order.
+# A room's lock is dropped once no write is using or waiting on it.
+background_tasks = set()
+message_locks = weakref.WeakValueDictionary()
+
+
+def finish_background_task(task: asyncio.Task) -> None:
+    """
+    Releases a finished background task and logs its failure, if any.
+
+    Args:
+        task (asyncio.Task): The completed task.
+
+    Returns:
+        None
+    """
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed", exc_info=task.exception())
+
+
+# Group broadcasts that arrive within this window (seconds) of a sent frame
+# are merged into a single frame, up to this many at a time
+BROADCAST_BATCH_WINDOW = 0.01
+BROADCAST_BATCH_MAX = 128
+
+# Actions a seated player can send (everything except "join")
+PLAYER_ACTIONS = frozenset({"leave", "fold", "check", "call", "bet"})
+
+# Fixed error frames, serialized once at import
+ERROR_NOT_PLAYING = orjson.dumps({"error": "You are not playing on this table"}).decode()
+ERROR_CANNOT_FOLD = orjson.dumps({"error": "You cannot fold."}).decode()
+ERROR_CANNOT_CHECK = orjson.dumps({"error": "Cannot check"}).decode()
+ERROR_CANNOT_CALL = orjson.dumps({"error": "You cannot call."}).decode()
+ERROR_NOTHING_TO_CALL = orjson.dumps({"error": "Cannot call, please check, raise or fold."}).decode()
+ERROR_CANNOT_BET = orjson.dumps({"error": "You cannot bet."}).decode()
+ERROR_INVALID_BET = orjson.dumps({"error": "Invalid bet amount."}).decode()
+
+
+def merge_frames(frames: list) -> str:
+    """
+    Merges several serialized broadcast payloads into a single one.
+
+    Messages are concatenated in order; for every other key (game state),
+    the most recent value wins, since a newer state replaces an older one
+    on the frontend anyway.
+
+    Args:
+        frames (list): JSON strings, oldest first.
+
+    Returns:
+        str: The merged JSON string.
+    """
+    merged = {}
+    messages = []
+    for frame in frames:
+        data = orjson.loads(frame)
+        messages.extend(data.pop("messages", []))
+        merged.update(data)
+    if messages:
+        merged["messages"] = messages
+    return orjson.dumps(merged).decode()
+
+
+def coalesce_frames(frames: list) -> list:
+    """
+    Turns a batch of queued frames into the frames to send, in order.
+
+    Consecutive public frames are merged into one (see merge_frames).
+    Private frames are never merged, and nothing is reordered around them,
+    so a private update always follows the public state queued before it.
+
+    Args:
+        frames (list): (JSON string, is_private) pairs, oldest first.
+
+    Returns:
+        list: The JSON strings to send, oldest first.
+    """
+    out = []
+    public = []
+    for text, is_private in frames:
+        if not is_private:
+            public.append(text)
+            continue
+        if public:
+            out.append(public[0] if len(public) == 1 else merge_frames(public))
+            public = []
+        out.append(text)
+    if public:
+        out.append(public[0] if len(public) == 1 else merge_frames(public))
+    return out
 
 
 class GameConsumer(AsyncWebsocketConsumer):
@@ -25,6 +131,10 @@ class GameConsumer(AsyncWebsocketConsumer):
     Manages player connections, actions, and game state updates.
     """
 
+    # Set up in connect() once the connection is accepted
+    outbox = None
+    outbox_task = None
+
     # =======================================================================
     # WEBSOCKET CONNECTION HANDLING
     # =======================================================================
@@ -42,24 +152,34 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("### CONNECT")
+        logger.debug("### CONNECT")
 
         self.game_id = self.scope["url_route"]["kwargs"]["game_id"]
         self.room_group_name = f"game_{self.game_id}"
         self.user = self.scope["user"]
         self.user_channel_name = f"user_{self.user.id}"
 
-        # Join the public game WebSocket room and a **private WebSocket group**
-        await self.channel_layer.group_add(
-            self.room_group_name, self.channel_name
-        )
-        await self.channel_layer.group_add(
-            self.user_channel_name, self.channel_name
-        )
+        # Join the public game WebSocket room and a **private WebSocket group**,
+        # while retrieving the game for the **private** updates below
+        try:
+            _, _, game = await asyncio.gather(
+                self.channel_layer.group_add(self.room_group_name, self.channel_name),
+                self.channel_layer.group_add(self.user_channel_name, self.channel_name),
+                Game.objects.aget(id=self.game_id),
+            )
+        except Game.DoesNotExist:
+            # Refuse the connection once, rather than failing on every action
+            logger.debug(" Game %s not found. Closing connection.", self.game_id)
+            await self.close()
+            return
         await self.accept()
 
-        # Retrieve game and send **private** updates only to this user
-        game = await sync_to_async(Game.objects.get)(id=self.game_id)
+        # Group broadcasts are queued and sent (batched) by a background task
+        self.outbox = asyncio.Queue()
+        self.outbox_task = asyncio.create_task(self.flush_outbox())
+
+        # Messages waiting to ride along with the next game state broadcast
+        self.pending_messages = []
 
         # Send private hole cards only to the reconnecting player, not broadcast
         await self.send_private_game_state(game, self.user)
@@ -69,7 +189,8 @@ class GameConsumer(AsyncWebsocketConsumer):
         """
         Handles the WebSocket disconnection.
  
-        Removes the user's connection from both the public game group and their private user group.
+        Removes the user's connection from both the public game group and their private user group,
+        and stops the broadcast sender task.
  
         Args:
             close_code: The WebSocket close code.
@@ -78,7 +199,7 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("### DISCONNECT")
+        logger.debug("### DISCONNECT")
 
         await self.channel_layer.group_discard(
             self.room_group_name, self.channel_name
@@ -87,6 +208,9 @@ class GameConsumer(AsyncWebsocketConsumer):
             self.user_channel_name, self.channel_name
         )
 
+        if self.outbox_task:
+            self.outbox_task.cancel()
+
     #
     #
     #
@@ -115,49 +239,55 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* RECEIVE")
+        logger.debug("* RECEIVE")
 
-        data = json.loads(text_data)
+        data = orjson.loads(text_data)
         action = data.get("action")
         player_username = data.get("player")
         amount = data.get("amount", 0)  # Only needed for bet/raise
 
         try:
-            game = await sync_to_async(Game.objects.get)(id=self.game_id)
-
             # Handle "join" first, since player may not exist in the game yet
             if action == "join":
-                await self.handle_join(game, player_username)
+                await self.handle_join(player_username)
                 return
 
-            # Fetch the player *after* handling "join"
-            player = await sync_to_async(
-                lambda: Player.objects.filter(
-                    game=game, user__username=player_username
-                ).first()
-            )()
+            # Ignore unknown actions before touching the database
+            if action not in PLAYER_ACTIONS:
+                return
+
+            # Fetch the player *after* handling "join", along with
+            # its game and user in a single query
+            player = await Player.objects.select_related("game", "user").filter(
+                game_id=self.game_id, user__username=player_username
+            ).afirst()
 
             # Check if player exist in this game
             if not player:
-                await self.send(
-                    text_data=json.dumps({"error": "You are not playing on this table"})
-                )
+                self.send_error(ERROR_NOT_PLAYING)
                 return
 
+            game = player.game
+
             # Handle possible actions from player
-            if action == "leave":
-                await self.handle_leave(game, player_username)
-            elif action == "fold":
-                await self.handle_fold(game, player)
-            elif action == "check":
-                await self.handle_check(game, player)
-            elif action == "call":
-                await self.handle_call(game, player)
-            elif action == "bet":
-                await self.handle_bet(game, player, amount)
+            match action:
+                case "leave":
+                    await self.handle_leave(game, player_username)
+                case "fold":
+                    await self.handle_fold(game, player)
+                case "check":
+                    await self.handle_check(game, player)
+                case "call":
+                    await self.handle_call(game, player)
+                case "bet":
+                    await self.handle_bet(game, player, amount)
 
         except Game.DoesNotExist:
-            print(f" Game {self.game_id} not found. Ignoring action: {action}")
+            logger.debug(" Game %s not found. Ignoring action: %s", self.game_id, action)
+
+        finally:
+            # Send whatever messages were not carried by a game state
+            await self.flush_messages()
 
         # except Exception as e:
         #     print(f"Unexpected error in receive: {e}")
@@ -257,66 +387,80 @@ class GameConsumer(AsyncWebsocketConsumer):
     #         self.broadcast_private(game),
     #     )
 
-    async def handle_join(self, game: Game, player_username: str) -> None:
+    async def handle_join(self, player_username: str) -> None:
         """
         Handles a player joining the game, with transaction safety and better structure.
+        The game is loaded (and locked) by the join transaction itself.
         """
 
-        print("* HANDLE JOIN")
-
-        try:
-            user = await sync_to_async(User.objects.get)(username=player_username)
-        except User.DoesNotExist:
-            await self.send(text_data=json.dumps({"error": "User not found"}))
-            return
+        logger.debug("* HANDLE JOIN")
 
         try:
-            await self.join_game_transaction(game.id, user.id)
+            game, player_count = await self.join_game_transaction(self.game_id, player_username)
+        except Game.DoesNotExist:
+            raise  # handled by receive
         except Exception as e:
-            await self.send(text_data=json.dumps({"error": str(e)}))
+            self.send_error(orjson.dumps({"error": str(e)}).decode())
             return
 
-        await self.broadcast_messages(f"🪑 {player_username} has joined the table.")
+        join_message = f"🪑 {player_username} has joined the table."
 
         # Check if game should start
-        player_count = await sync_to_async(lambda: game.players.count())()
         if game.game_type == "sit_and_go" and player_count == game.max_players:
+            await self.broadcast_messages(join_message)
             await self.start_hand(game)
         else:
+            # Only the joining player's chips changed privately (the buy-in),
+            # so there is no need to resend everyone's private state
             await asyncio.gather(
-                self.broadcast_game_state(game),
-                self.broadcast_private(game),
+                self.broadcast_game_state(game, join_message),
+                self.send_private_to_user(self.user),
             )
 
     @sync_to_async
     @transaction.atomic
-    def join_game_transaction(self, game_id, user_id):
+    def join_game_transaction(self, game_id, username):
+        """
+        Seats the user at the table and deducts the buy-in.
+
+        Returns:
+            tuple: The game, and the number of players seated after this join.
+        """
         game = Game.objects.select_for_update().get(id=game_id)
-        user = User.objects.select_related("profile").get(id=user_id)
-        profile = user.profile
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise Exception("User not found")
 
-        if game.players.filter(user=user).exists():
+        # Seats and occupants in one query
+        seats = dict(game.players.values_list("position", "user_id"))
+
+        if user.id in seats.values():
             raise Exception("You're already seated at this table")
 
-        taken_positions = list(game.players.values_list("position", flat=True))
-        available_positions = [pos for pos in range(game.max_players) if pos not in taken_positions]
+        # Lowest free seat (dict lookup, stops at the first match)
+        position = next((pos for pos in range(game.max_players) if pos not in seats), None)
 
-        if not available_positions:
+        if position is None:
             raise Exception("Table is full")
 
-        if profile.chips < game.buy_in:
+        # Check and deduct the buy-in in one UPDATE, so concurrent joins
+        # (e.g. at two tables) can't both spend the same chips
+        deducted = Profile.objects.filter(user=user, chips__gte=game.buy_in).update(
+            chips=F("chips") - game.buy_in
+        )
+        if not deducted:
             raise Exception("Not enough chips")
 
-        profile.chips -= game.buy_in
-        profile.save()
-
         Player.objects.create(
             game=game,
             user=user,
-            position=min(available_positions),
+            position=position,
             chips=game.buy_in
         )
 
+        return game, len(seats) + 1
+
     # -----------------------------------------------------------------------
     # async def handle_leave(self, game:Game, player_username: str) -> None:
     #     """
@@ -410,7 +554,7 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* HANDLE LEAVE")
+        logger.debug("* HANDLE LEAVE")
     
         game = await self.leave_game_transaction(game.id, player_username)
         # game = await sync_to_async(Game.objects.get)(id=game.id) #re-fetch after transaction
@@ -423,8 +567,7 @@ class GameConsumer(AsyncWebsocketConsumer):
     
         leave_message = f"⚠️ {player_username} has left the table."
         await asyncio.gather(
-            self.broadcast_messages(leave_message),
-            self.broadcast_game_state(game),
+            self.broadcast_game_state(game, leave_message),
             self.send_private_to_user(self.user),
         )
 
@@ -432,27 +575,27 @@ class GameConsumer(AsyncWebsocketConsumer):
     @transaction.atomic
     def leave_game_transaction(self, game_id, username):
         game = Game.objects.select_for_update().get(id=game_id)
-        player = game.players.select_related("user__profile").filter(user__username=username).first()
+        player = game.players.filter(user__username=username).first()
 
         if not player:
             raise Exception("Player not found")
 
         player_position = player.position
 
-        # Refund buy-in if game hasn't started
+        # Refund buy-in if game hasn't started (a single UPDATE, no read)
         if game.game_type == "sit_and_go" and game.status == "waiting":
-            profile = player.user.profile
-            profile.chips += game.buy_in
-            profile.save()
+            Profile.objects.filter(user_id=player.user_id).update(
+                chips=F("chips") + game.buy_in
+            )
 
         # Delete the player
         player.delete()
 
-        # Renumber positions
+        # Renumber positions, writing every seat in one query
         remaining_players = list(game.players.order_by("position"))
         for new_pos, p in enumerate(remaining_players):
             p.position = new_pos
-            p.save()
+        Player.objects.bulk_update(remaining_players, ["position"])
 
         # Update game state if necessary
         if len(remaining_players) < 2:
@@ -463,7 +606,7 @@ class GameConsumer(AsyncWebsocketConsumer):
             if game.current_turn == player_position:
                 game.current_turn = remaining_players[0].position
 
-        game.save()
+        game.save(update_fields=["status", "dealer_position", "current_turn"])
         return game
     
 
@@ -485,31 +628,48 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* HANDLE FOLD")
+        logger.debug("* HANDLE FOLD")
 
         # Safety Check
         if player.is_all_in or player.has_folded:
-            await self.send(text_data=json.dumps({"error": "You cannot fold."}))
+            self.send_error(ERROR_CANNOT_FOLD)
             return
         
-        username = await sync_to_async(
-            lambda: player.user.username, thread_sensitive=True
-        )()
+        username = player.user.username
         await self.broadcast_messages(f"🔴 {username} folded.")
         
-        player.has_folded = True
-        player.has_acted_this_round = True
-        await sync_to_async(player.save)()
+        # Save the fold and get the players still in the hand
+        active_players = await self.fold_player(game, player)
 
         # Check if only one active player remains
-        active_players = await sync_to_async(
-            lambda: list(game.players.filter(has_folded=False)), thread_sensitive=True
-        )()
         if len(active_players) == 1:
             await self.end_phase(game, winner=active_players[0])
             return
 
-        await self.post_action_flow(game)
+        await self.post_action_flow(game, active_players)
+
+
+    # -----------------------------------------------------------------------
+    @sync_to_async
+    def fold_player(self, game: Game, player: Player) -> list:
+        """
+        Marks the player as folded and returns the players still in the hand.
+
+        Runs in a single thread hop.
+
+        Args:
+            game (Game): The current game instance.
+            player (Player): The player folding their hand.
+
+        Returns:
+            list: The non-folded players ordered by position, with their users.
+        """
+        player.has_folded = True
+        player.has_acted_this_round = True
+        player.save(update_fields=["has_folded", "has_acted_this_round"])
+        return list(
+            game.players.select_related("user").filter(has_folded=False).order_by("position")
+        )
 
 
     # -----------------------------------------------------------------------
@@ -528,33 +688,50 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* HANDLE CHECK")
+        logger.debug("* HANDLE CHECK")
 
-        can_check = await sync_to_async(
-            lambda: can_user_do_action(game, player, "check")
-        )()
+        # Validate and save the check in a single thread hop
+        can_check = await self.check_player(game, player)
 
         if can_check == True :
-            print("YES CAN CHECK")
-            # Mark the player as checked
-            player.has_checked = True
-            player.has_acted_this_round = True
-            await sync_to_async(player.save)()
+            logger.debug("YES CAN CHECK")
 
             # Broadcast
-            username = await sync_to_async(
-                lambda: player.user.username, thread_sensitive=True
-            )()
+            username = player.user.username
             await self.broadcast_messages(f"🔵 {username} checked.")
         
         else :
-            await self.send(json.dumps({"error": "Cannot check"}))
+            self.send_error(ERROR_CANNOT_CHECK)
             return
 
         # Move to the post action flow
         await self.post_action_flow(game)
 
 
+    # -----------------------------------------------------------------------
+    @sync_to_async
+    def check_player(self, game: Game, player: Player) -> bool:
+        """
+        Marks the player as checked, if checking is allowed.
+
+        Runs in a single thread hop.
+
+        Args:
+            game (Game): The current game instance.
+            player (Player): The player choosing to check.
+
+        Returns:
+            bool: True if the check was allowed and saved.
+        """
+        if not can_user_do_action(game, player, "check"):
+            return False
+
+        player.has_checked = True
+        player.has_acted_this_round = True
+        player.save(update_fields=["has_checked", "has_acted_this_round"])
+        return True
+
+
     # -----------------------------------------------------------------------
     async def handle_call(self, game: Game, player: Player) -> None:
         """
@@ -572,23 +749,57 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* HANDLE CALL")
+        logger.debug("* HANDLE CALL")
 
         # Safety Check
         if player.is_all_in or player.has_folded:
-            await self.send(text_data=json.dumps({"error": "You cannot call."}))
+            self.send_error(ERROR_CANNOT_CALL)
             return
         
+        # Validate and save the call in a single thread hop
+        call_amount = await self.call_player(game, player)
+
+        if call_amount is None:
+            self.send_error(ERROR_NOTHING_TO_CALL)
+            return
+     
+        # Broadcast
+        username = player.user.username
+
+        if player.is_all_in:
+            await self.broadcast_messages(
+                f"🟣 {username} goes ALL-IN with {call_amount} chips!"
+            )
+        else:
+            await self.broadcast_messages(f"🟢 {username} called {call_amount} chips.")
+
+        # Move to the post action flow
+        await self.post_action_flow(game)
+
+
+
+    # -----------------------------------------------------------------------
+    @sync_to_async
+    def call_player(self, game: Game, player: Player):
+        """
+        Moves the player's chips to match the highest bet, if there is one to call.
+
+        Runs in a single thread hop: reads the highest bet and saves the player.
+
+        Args:
+            game (Game): The current game instance.
+            player (Player): The player calling a bet.
+
+        Returns:
+            int: The amount called (the player's remaining chips if all-in),
+            or None if there is nothing to call.
+        """
         # Get the highest bet currently on the table
-        highest_bet = await sync_to_async(
-            lambda: max(game.players.values_list("current_bet", flat=True), default=0)
-        )()
+        highest_bet = game.get_highest_bet()
 
         call_amount = highest_bet - player.current_bet
-
         if call_amount <= 0:
-            await self.send(text_data=json.dumps({"error": "Cannot call, please check, raise or fold."}))
-            return
+            return None
 
         # Handle all-in scenario
         if player.chips <= call_amount:
@@ -600,22 +811,10 @@ class GameConsumer(AsyncWebsocketConsumer):
         player.current_bet += call_amount
         player.total_bet += call_amount
         player.has_acted_this_round = True
-        await sync_to_async(player.save)()
-     
-        # Broadcast
-        username = await sync_to_async(
-            lambda: player.user.username, thread_sensitive=True
-        )()
-
-        if player.is_all_in:
-            await self.broadcast_messages(
-                f"🟣 {username} goes ALL-IN with {call_amount} chips!"
-            )
-        else:
-            await self.broadcast_messages(f"🟢 {username} called {call_amount} chips.")
-
-        # Move to the post action flow
-        await self.post_action_flow(game)
+        player.save(update_fields=[
+            "chips", "current_bet", "total_bet", "is_all_in", "has_acted_this_round",
+        ])
+        return call_amount
 
 
 
@@ -637,27 +836,25 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* HANDLE BET")
+        logger.debug("* HANDLE BET")
         
         # Safety Check
         if player.is_all_in or player.has_folded:
-            await self.send(text_data=json.dumps({"error": "You cannot bet."}))
+            self.send_error(ERROR_CANNOT_BET)
             return
         
         # Validate the bet amount
         if amount <= 0 or amount > player.chips:
-            await self.send(text_data=json.dumps({"error": "Invalid bet amount."}))
+            self.send_error(ERROR_INVALID_BET)
             return
         
-        highest_bet = await sync_to_async(
-            lambda: max(game.players.values_list("current_bet", flat=True), default=0)
-        )()
+        highest_bet = await sync_to_async(game.get_highest_bet)()
 
         big_blind = game.big_blind
 
         min_bet = big_blind if highest_bet == 0 else max(big_blind, highest_bet * 2)
         if amount < min_bet and player.chips > min_bet:
-            await self.send(json.dumps({"error": f"Minimum raise is {min_bet} chips."}))
+            self.send_error(orjson.dumps({"error": f"Minimum raise is {min_bet} chips."}).decode())
             return
 
         # All-in check
@@ -670,13 +867,13 @@ class GameConsumer(AsyncWebsocketConsumer):
         player.current_bet += amount
         player.total_bet += amount
         player.has_acted_this_round = True
-        await sync_to_async(player.save)()
+        await player.asave(update_fields=[
+            "chips", "current_bet", "total_bet", "is_all_in", "has_acted_this_round",
+        ])
        
 
         # Broadcast
-        username = await sync_to_async(
-            lambda: player.user.username, thread_sensitive=True
-        )()
+        username = player.user.username
 
         if player.is_all_in:
             await self.broadcast_messages(
@@ -694,7 +891,7 @@ class GameConsumer(AsyncWebsocketConsumer):
   
 
     # -----------------------------------------------------------------------
-    async def post_action_flow(self, game: Game) -> None:
+    async def post_action_flow(self, game: Game, active_players: list = None) -> None:
         """
         Handles game progression after each player's action.
 
@@ -704,14 +901,21 @@ class GameConsumer(AsyncWebsocketConsumer):
 
         Args:
             game (Game): The current game instance.
+            active_players (list, optional): Non-folded players ordered by position,
+                if the caller already fetched them. Queried when omitted.
 
         Returns:
             None
         """
 
-        print("* POST ACTION FLOW")
+        logger.debug("* POST ACTION FLOW")
 
-        active_players = await sync_to_async(lambda: list(game.players.filter(has_folded=False)), thread_sensitive=True)()
+        # Fetched once and handed to is_phase_over / end_phase / next_player below
+        if active_players is None:
+            active_players = await sync_to_async(
+                lambda: list(game.players.filter(has_folded=False).order_by("position")),
+                thread_sensitive=True,
+            )()
 
         # General all-in logic for 2+ players
         non_folded = [p for p in active_players if not p.has_folded]
@@ -735,13 +939,11 @@ class GameConsumer(AsyncWebsocketConsumer):
                 return
 
         # Check if the phase is over
-        if await self.is_phase_over(game):
-            await self.end_phase(game)
+        if await self.is_phase_over(game, active_players):
+            await self.end_phase(game, active_players=active_players)
         else:
-            print("-----------------")
-            print(game.current_turn)
-            print("-----------------")
-            await self.next_player(game, game.current_turn)
+            logger.debug("Current turn: %s", game.current_turn)
+            await self.next_player(game, game.current_turn, active_players)
 
 
    
@@ -774,83 +976,79 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* START HAND")
+        logger.debug("* START HAND")
 
-        # Fetch active players
+        # Fetch active players (this list is shared by the steps below)
         players = await sync_to_async(
-            lambda: list(game.players.order_by("position")), thread_sensitive=True
+            lambda: list(game.players.select_related("user__profile").order_by("position")),
+            thread_sensitive=True,
         )()
 
         # Reset and start the hand!
-        await self.reset_hand(game)
+        await self.reset_hand(game, players)
 
         # Get blind amounts
         big_blind = game.big_blind
 
         # Iterate over players and check chip status
+        removed_players = False
         for player in players:
             if player.chips == 0:
-                username = await sync_to_async(
-                    lambda: player.user.username, thread_sensitive=True
-                )()
-                print(f"{username} has no chips left and will be removed from the game.")
+                username = player.user.username
+                logger.debug("%s has no chips left and will be removed from the game.", username)
                 await self.handle_leave(game, username)  # Remove player from the game
+                removed_players = True
             elif player.chips < big_blind:
-                username = await sync_to_async(
-                    lambda: player.user.username, thread_sensitive=True
-                )()
-                print(f"{username} does not have enough for blinds and will go all-in.")
-
-        # Fetch active players again (updated)
-        players = await sync_to_async(
-            lambda: list(game.players.order_by("position")), thread_sensitive=True
-        )()
+                username = player.user.username
+                logger.debug("%s does not have enough for blinds and will go all-in.", username)
+
+        # Fetch active players again if seats changed (leaving renumbers positions)
+        if removed_players:
+            players = await sync_to_async(
+                lambda: list(game.players.select_related("user__profile").order_by("position")),
+                thread_sensitive=True,
+            )()
 
         # If only 1 player remains, end the hand
         if len(players) == 1:
-            print("*** Only 1 player left. Ending game and transferring chips.")
+            logger.debug("*** Only 1 player left. Ending game and transferring chips.")
             await self.transfer_chips_to_profile(game, players[0])
-            username = await sync_to_async(
-                lambda: players[0].user.username, thread_sensitive=True
-            )()
+            username = players[0].user.username
             await self.broadcast_private(game)
             await self.handle_leave(game, username)  # Remove player from the game
             return
 
 
         # Assign dealer
-        await self.rotate_dealer(game)
+        await self.rotate_dealer(game, players)
 
         # Assign Small & Big Blinds
-        await self.assign_blinds(game)
+        await self.assign_blinds(game, players)
 
         # Create a deck (52 cards)
-        deck = await sync_to_async(
-            lambda: create_deck()
-        )()
+        deck = create_deck()
 
-        # Shuffle and save the deck
+        # Shuffle and keep only the cards this hand can use: two hole cards
+        # per player, plus 3 burns and 5 community cards. The stored deck
+        # is rewritten on every street, so a short one is cheaper to save.
         random.shuffle(deck)
-        game.deck = deck
+        game.deck = deck[:2 * len(players) + 8]
 
         # Deal Hole Cards
-        await self.deal(game)
+        await self.deal(game, players)
 
         # Update Game Status
         game.status = "active"
         
         # Save
-        await sync_to_async(game.save)()
+        await game.asave(update_fields=["deck", "status"])
  
         # Broadcast
-        await asyncio.gather(
-            self.broadcast_messages("🚀 Starting a new hand."),
-            self.broadcast_game_state(game),
-        )
+        await self.broadcast_game_state(game, "🚀 Starting a new hand.", private=True)
 
 
     # -----------------------------------------------------------------------
-    async def reset_hand(self, game: Game) -> None:
+    async def reset_hand(self, game: Game, players: list = None) -> None:
         """
         Resets the hand state before a new hand begins.
     
@@ -859,19 +1057,21 @@ class GameConsumer(AsyncWebsocketConsumer):
     
         Args:
             game (Game): The current game instance.
+            players (list, optional): The game's players, if already fetched.
     
         Returns:
             None
         """
 
-        print("* RESET HAND")
+        logger.debug("* RESET HAND")
 
         game.current_turn = None
         game.deck = []
         game.community_cards = []
         game.current_phase = "preflop"
 
-        players = await sync_to_async(lambda: list(game.players.all()), thread_sensitive=True)()
+        if players is None:
+            players = await sync_to_async(lambda: list(game.players.all()), thread_sensitive=True)()
         for player in players:
             player.total_bet = 0
             player.has_folded = False
@@ -880,13 +1080,20 @@ class GameConsumer(AsyncWebsocketConsumer):
             player.is_big_blind = False
             player.has_checked = False
             player.has_acted_this_round = False
-            await sync_to_async(player.save)()
+
+        # Write every player's reset in one query
+        await sync_to_async(Player.objects.bulk_update)(players, [
+            "total_bet", "has_folded", "is_all_in", "is_small_blind",
+            "is_big_blind", "has_checked", "has_acted_this_round",
+        ])
         
-        await sync_to_async(game.save)()
+        await game.asave(
+            update_fields=["current_turn", "deck", "community_cards", "current_phase"]
+        )
 
 
     # -----------------------------------------------------------------------
-    async def rotate_dealer(self, game: Game) -> None:
+    async def rotate_dealer(self, game: Game, players: list = None) -> None:
         """
         Assigns the dealer position to the next player in order.
  
@@ -895,17 +1102,19 @@ class GameConsumer(AsyncWebsocketConsumer):
  
         Args:
             game (Game): The current game instance.
+            players (list, optional): The game's players ordered by position, if already fetched.
  
         Returns:
             None
         """
 
-        print("* ROTATE DEALER")
+        logger.debug("* ROTATE DEALER")
 
         # Get all players sorted by their 'position' field
-        players = await sync_to_async(
-            lambda: list(game.players.order_by("position")), thread_sensitive=True
-        )()
+        if players is None:
+            players = await sync_to_async(
+                lambda: list(game.players.order_by("position")), thread_sensitive=True
+            )()
 
         # Safety check
         if len(players) < 2:
@@ -931,13 +1140,15 @@ class GameConsumer(AsyncWebsocketConsumer):
         new_dealer = players[new_dealer_index]
       
         # Reset the is_dealer flag for all players and assign to new dealer
-        await sync_to_async(lambda: Player.objects.filter(game=game).update(is_dealer=False))()
+        await game.players.aupdate(is_dealer=False)
+        for player in players:
+            player.is_dealer = False  # keep the in-memory list in sync with the update
         new_dealer.is_dealer = True
-        await sync_to_async(new_dealer.save)()
+        await new_dealer.asave(update_fields=["is_dealer"])
 
         # Update game
         game.dealer_position = new_dealer.position
-        await sync_to_async(game.save)()
+        await game.asave(update_fields=["dealer_position"])
 
          # Broadcast
         # new_dealer_username = await sync_to_async(
@@ -947,7 +1158,7 @@ class GameConsumer(AsyncWebsocketConsumer):
 
 
     # -----------------------------------------------------------------------
-    async def assign_blinds(self, game: Game) -> None:
+    async def assign_blinds(self, game: Game, players: list = None) -> None:
         """
         Assigns small and big blinds to players.
  
@@ -957,18 +1168,20 @@ class GameConsumer(AsyncWebsocketConsumer):
  
         Args:
             game (Game): The game instance in progress.
+            players (list, optional): The game's players ordered by position, if already fetched.
  
         Returns:
             None
         """
 
-        print("* ASSIGN BLINDS")
+        logger.debug("* ASSIGN BLINDS")
 
         # Fetch the sorted player list
-        players = await sync_to_async(
-            lambda: list(game.players.order_by("position")),
-            thread_sensitive=True,
-        )()
+        if players is None:
+            players = await sync_to_async(
+                lambda: list(game.players.order_by("position")),
+                thread_sensitive=True,
+            )()
 
         if len(players) < 2:
             return # Safety check
@@ -1014,17 +1227,21 @@ class GameConsumer(AsyncWebsocketConsumer):
         small_blind_player.current_bet = small_blind
         small_blind_player.total_bet += small_blind
         small_blind_player.is_small_blind = True
-        await sync_to_async(small_blind_player.save)()
+        await small_blind_player.asave(
+            update_fields=["chips", "current_bet", "total_bet", "is_small_blind"]
+        )
 
         # Deduct big blind
         big_blind_player.chips -= big_blind
         big_blind_player.current_bet = big_blind
         big_blind_player.total_bet += big_blind
         big_blind_player.is_big_blind = True
-        await sync_to_async(big_blind_player.save)()
+        await big_blind_player.asave(
+            update_fields=["chips", "current_bet", "total_bet", "is_big_blind"]
+        )
 
         # Save
-        await sync_to_async(game.save)()
+        await game.asave(update_fields=["current_turn"])
 
 
 
@@ -1096,7 +1313,7 @@ class GameConsumer(AsyncWebsocketConsumer):
 
     #     return game.current_turn
 
-    async def next_player(self, game: Game, start_position: int) -> int:
+    async def next_player(self, game: Game, start_position: int, all_active_players: list = None) -> int:
         """
         Determines and sets the next player to act based on current game state.
         Skips players who are folded or all-in. If no player needs to act, ends the betting round.
@@ -1104,24 +1321,27 @@ class GameConsumer(AsyncWebsocketConsumer):
         Args:
             game (Game): The current game instance.
             start_position (int): The seat number of the last acting player.
+            all_active_players (list, optional): Non-folded players ordered by position,
+                if the caller already fetched them. Queried when omitted.
 
         Returns:
             int: The seat number of the next player, or None if the betting round is complete.
         """
-        print("* NEXT PLAYER")
-        print("*** Provided start_position (seat):", start_position)
+        logger.debug("* NEXT PLAYER")
+        logger.debug("*** Provided start_position (seat): %s", start_position)
 
         # Fetch all players who have not folded
-        all_active_players = await sync_to_async(
-            lambda: list(game.players.filter(has_folded=False).order_by("position")),
-            thread_sensitive=True
-        )()
+        if all_active_players is None:
+            all_active_players = await sync_to_async(
+                lambda: list(game.players.filter(has_folded=False).order_by("position")),
+                thread_sensitive=True
+            )()
 
         # Split into those who can act (not all-in) and all for highest_bet calculation
         eligible_players = [p for p in all_active_players if not p.is_all_in]
 
         if not eligible_players:
-            print("*** No eligible players found. Advancing to showdown.")
+            logger.debug("*** No eligible players found. Advancing to showdown.")
             while game.current_phase != "showdown":
                 await self.goto_next_phase(game)
             await self.start_hand(game)
@@ -1129,14 +1349,17 @@ class GameConsumer(AsyncWebsocketConsumer):
 
         # Compute highest bet among all (including all-ins) to fairly assess who needs to act
         highest_bet = max(p.current_bet for p in all_active_players)
-        print("*** Highest bet among all active players:", highest_bet)
+        logger.debug("*** Highest bet among all active players: %s", highest_bet)
 
         # Build circular player order after start_position
         after = [p for p in eligible_players if p.position > start_position]
         before = [p for p in eligible_players if p.position <= start_position]
         circular_order = after + before
 
-        print("*** Circular order of eligible players (by seat):", [p.position for p in circular_order])
+        logger.debug(
+            "*** Circular order of eligible players (by seat): %s",
+            [p.position for p in circular_order],
+        )
 
         candidate = None
         for p in circular_order:
@@ -1145,12 +1368,12 @@ class GameConsumer(AsyncWebsocketConsumer):
                 break
 
         if candidate is None:
-            print("*** No player needs to act. Betting round is complete.")
+            logger.debug("*** No player needs to act. Betting round is complete.")
             return None
 
-        print("*** Next candidate seat:", candidate.position)
+        logger.debug("*** Next candidate seat: %s", candidate.position)
         game.current_turn = candidate.position
-        await sync_to_async(game.save)()
+        await game.asave(update_fields=["current_turn"])
         await self.broadcast_game_state(game)
         return candidate.position
 
@@ -1169,7 +1392,7 @@ class GameConsumer(AsyncWebsocketConsumer):
     # =======================================================================
 
     # -----------------------------------------------------------------------
-    async def is_phase_over(self, game: Game) -> bool:
+    async def is_phase_over(self, game: Game, active_players: list = None) -> bool:
         """
         Determines if the current betting phase should end.
  
@@ -1181,17 +1404,20 @@ class GameConsumer(AsyncWebsocketConsumer):
  
         Args:
             game (Game): The current game instance.
+            active_players (list, optional): Non-folded players ordered by position,
+                if the caller already fetched them. Queried when omitted.
  
         Returns:
             bool: True if the phase should end, False otherwise.
         """
 
-        print("* CHECK IF PHASE IS OVER")
+        logger.debug("* CHECK IF PHASE IS OVER")
 
-        active_players = await sync_to_async(
-            lambda: list(game.players.filter(has_folded=False).order_by("position")),
-            thread_sensitive=True,
-        )()
+        if active_players is None:
+            active_players = await sync_to_async(
+                lambda: list(game.players.filter(has_folded=False).order_by("position")),
+                thread_sensitive=True,
+            )()
 
         
 
@@ -1199,9 +1425,7 @@ class GameConsumer(AsyncWebsocketConsumer):
         if len(active_players) <= 1:
             return False
 
-        highest_bet = await sync_to_async(
-            lambda: max(game.players.values_list("current_bet", flat=True))
-        )()
+        highest_bet = await sync_to_async(game.get_highest_bet)()
 
     
         # If all active players have checked with no bet
@@ -1231,17 +1455,21 @@ class GameConsumer(AsyncWebsocketConsumer):
         else:
             phase_over = False
 
-        print("* Checking if phase is over...")
-        for p in active_players:
-            print(f"Player {p.position}: bet={p.current_bet}, acted={p.has_acted_this_round}, folded={p.has_folded}, all_in={p.is_all_in}")
-        print(f"Highest bet: {highest_bet}")
-        print(f"All players checked: {all_players_checked}")
-        print(f"All players matched bet: {all_players_matched_bet}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("* Checking if phase is over...")
+            for p in active_players:
+                logger.debug(
+                    "Player %s: bet=%s, acted=%s, folded=%s, all_in=%s",
+                    p.position, p.current_bet, p.has_acted_this_round, p.has_folded, p.is_all_in,
+                )
+            logger.debug("Highest bet: %s", highest_bet)
+            logger.debug("All players checked: %s", all_players_checked)
+            logger.debug("All players matched bet: %s", all_players_matched_bet)
         return phase_over
 
 
     # -----------------------------------------------------------------------
-    async def end_phase(self, game: Game, winner=None) -> None:
+    async def end_phase(self, game: Game, winner=None, active_players: list = None) -> None:
         """
         Ends the current betting phase and prepares for the next phase or starts a new hand.
  
@@ -1252,31 +1480,33 @@ class GameConsumer(AsyncWebsocketConsumer):
         Args:
             game (Game): The current game instance.
             winner (Player, optional): The player who wins by default due to all others folding.
+            active_players (list, optional): Non-folded players ordered by position.
+                Reset in memory and reused to pick the next player, instead of a new query.
  
         Returns:
             None
         """
 
-        print("* END PHASE")
+        logger.debug("* END PHASE")
 
-        # Reset each player's current bet & checked status for the next phase/hand
-        players = await sync_to_async(
-            lambda: list(game.players.all()), thread_sensitive=True
-        )()
-        for player in players:
-            player.current_bet = 0
-            player.has_checked = False
-            player.has_acted_this_round = False
-            await sync_to_async(player.save)()
+        # Reset each player's current bet & checked status for the next phase/hand,
+        # in a single UPDATE, and mirror it on the players we already hold
+        await game.players.aupdate(
+            current_bet=0, has_checked=False, has_acted_this_round=False
+        )
+        for p in active_players or ():
+            p.current_bet = 0
+            p.has_checked = False
+            p.has_acted_this_round = False
 
          # If there's a forced winner (1 player left after folds),
         if winner:
             # Get the current pot amount
-            pot = await sync_to_async(lambda: game.get_pot(), thread_sensitive=True)()
+            pot = await sync_to_async(game.get_pot)()
             winner.chips += pot
-            await sync_to_async(winner.save)()
+            await winner.asave(update_fields=["chips"])
 
-            username = await sync_to_async(lambda: winner.user.username)()
+            username = winner.user.username
             await self.broadcast_messages(
                 f"🏆 {username} is the last player and wins the pot of {pot} chips!"
             )
@@ -1294,7 +1524,7 @@ class GameConsumer(AsyncWebsocketConsumer):
         
         # else move current player after the dealer
         else:
-            await self.next_player(game, game.dealer_position)
+            await self.next_player(game, game.dealer_position, active_players)
 
 
    
@@ -1311,22 +1541,22 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* GOTO NEXT PHASE")
+        logger.debug("* GOTO NEXT PHASE")
         next_phase = get_next_phase(game.current_phase)
         game.current_phase = next_phase
-        await sync_to_async(game.save)()
 
-
-        print("** NEXT PHASE :",next_phase)
+        logger.debug("** NEXT PHASE : %s", next_phase)
         if next_phase not in {"flop", "turn", "river", "showdown"}:
+            await game.asave(update_fields=["current_phase"])
             return #Safety check
 
         if next_phase == "showdown":
+            await game.asave(update_fields=["current_phase"])
             await self.handle_showdown(game)
             return
         
         # Burn one card
-        Game.burn_card(game)
+        game.burn_card()
 
         # Determine how many cards to deal
         cards_to_deal = 3 if next_phase == "flop" else 1
@@ -1334,12 +1564,11 @@ class GameConsumer(AsyncWebsocketConsumer):
         game.community_cards.extend(dealt_cards)
         game.deck = game.deck[cards_to_deal:]
 
-        # Save
-       #  game.current_phase = next_phase
-        await sync_to_async(game.save)()
+        # Save the new phase and its cards in a single UPDATE
+        await game.asave(update_fields=["current_phase", "community_cards", "deck"])
 
         # Broadcast
-        cards_pretty = await sync_to_async(convert_treys_str_int_pretty)(game.community_cards)
+        cards_pretty = convert_treys_str_int_pretty(game.community_cards)
         phase_label = f"📡 {next_phase.capitalize()} : {cards_pretty}"
         await self.broadcast_messages(phase_label)
 
@@ -1362,17 +1591,20 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        print("* MOVE TO SHOWDOWN")
+        logger.debug("* MOVE TO SHOWDOWN")
 
-        active_players = await sync_to_async(
-            lambda: list(game.players.filter(has_folded=False)), thread_sensitive=True
+        # One query for everyone at the table; folded players still count
+        # towards the side pots below
+        all_players = await sync_to_async(
+            lambda: list(game.players.select_related("user")),
+            thread_sensitive=True,
         )()
+        active_players = [p for p in all_players if not p.has_folded]
 
         if not active_players:
             return # Safety check
 
         # Sort players by total bet (all players, including folded)
-        all_players = await sync_to_async(lambda: list(game.players.all()), thread_sensitive=True)()
         all_players.sort(key=lambda p: p.total_bet)
  
         # Build side pots including folded players' contributions
@@ -1387,14 +1619,13 @@ class GameConsumer(AsyncWebsocketConsumer):
                 side_pots.append({"amount": pot_size, "eligible_ids": eligible_players})
                 previous_bet = current_bet
 
-        print(side_pots)
+        logger.debug("Side pots: %s", side_pots)
         
         # Evaluate each player's best 5-card hand
         player_hands = []
         for player in active_players:
-            username = await sync_to_async(lambda: player.user.username)()
             combined_cards = game.community_cards + player.hole_cards
-            score, rank, best_5_ints = await sync_to_async(find_best_five_cards)(combined_cards)
+            score, rank, best_5_ints = find_best_five_cards(combined_cards)
             player_hands.append((score, rank, best_5_ints, player))
 
         # Sort from best to worst (lowest treys score = best hand)
@@ -1426,16 +1657,18 @@ class GameConsumer(AsyncWebsocketConsumer):
           
             for (win_score, win_rank, win_5, win_player) in winners:
                 winnings[win_player]["chips_won"] += share
-                winnings[win_player]["best_score"] = score
-                winnings[win_player]["best_rank"] = rank
+                winnings[win_player]["best_score"] = win_score
+                winnings[win_player]["best_rank"] = win_rank
                 winnings[win_player]["best_five"] = win_5
                 win_player.chips += share
-                await sync_to_async(win_player.save)()
 
-        
+        # Write every winner's chips in one query, rather than one save per pot share
+        if winnings:
+            await sync_to_async(Player.objects.bulk_update)(list(winnings), ["chips"])
+
         # Now broadcast once per winning player
         for win_player, info in winnings.items():
-            username = await sync_to_async(lambda: win_player.user.username)()
+            username = win_player.user.username
             best_five_str = Card.ints_to_pretty_str(info["best_five"]).replace(",", "")
             rank_desc = info["best_rank"]
             total_chips = info["chips_won"]
@@ -1457,29 +1690,33 @@ class GameConsumer(AsyncWebsocketConsumer):
 
 
     # -----------------------------------------------------------------------
-    async def deal(self, game: Game) -> None:
+    async def deal(self, game: Game, players: list = None) -> None:
         """
         Deals two hole cards to each player in proper order.
  
         Distributes one card at a time to each player, twice around the table,
-        starting from the left of the dealer. Cards are stored in the database and
-        broadcasted privately to each player.
+        starting from the left of the dealer. Cards are stored in the database;
+        start_hand then sends them privately to each player.
  
         Args:
             game (Game): The current game instance.
+            players (list, optional): The game's players (with users) ordered by position,
+                if already fetched.
  
         Returns:
             None
         """
 
-        # Init
-        dealt_cards = {}
+        # Init (cards are taken from the top of the deck, index 0 onwards)
         deck = game.deck
+        next_card = 0
 
         # Fetch players in correct order
-        players = await sync_to_async(
-            lambda: list(game.players.order_by("position")), thread_sensitive=True
-        )()
+        if players is None:
+            players = await sync_to_async(
+                lambda: list(game.players.select_related("user").order_by("position")),
+                thread_sensitive=True,
+            )()
 
         # Safety check
         if not players:
@@ -1491,42 +1728,32 @@ class GameConsumer(AsyncWebsocketConsumer):
             (i for i, p in enumerate(players) if p.position == dealer_position), -1
         )
         if start_index == -1:
-            print("Dealer not found. Cannot proceed with dealing.")
+            logger.debug("Dealer not found. Cannot proceed with dealing.")
             return
 
+        # Start every hand from empty
+        for player in players:
+            player.hole_cards = []
+
         # Deal cards in two rounds
         for _ in range(2):  # Two hole cards per player
             for i in range(len(players)):
                 player = players[
                     (start_index + i + 1) % len(players)
                 ]  # Next player after dealer
-                card = deck.pop(0)
+                card = deck[next_card]
+                next_card += 1
 
                 # Append card to player's hand
-                username = await sync_to_async(
-                    lambda: player.user.username, thread_sensitive=True
-                )()
-                if username not in dealt_cards:
-                    dealt_cards[username] = []
-                dealt_cards[username].append(card)
-
-                # Save hole cards to database
-                for player in players:
-                    username = await sync_to_async(
-                        lambda: player.user.username, thread_sensitive=True
-                    )()
-                    if username in dealt_cards:
-                        await sync_to_async(player.set_hole_cards)(
-                            dealt_cards[username]
-                        )
-
-        game.deck = deck
+                player.hole_cards.append(card)
 
-        # Save
-        await sync_to_async(game.save)()
+        # Save all hole cards to database at once
+        await sync_to_async(Player.objects.bulk_update)(players, ["hole_cards"])
+
+        game.deck = deck[next_card:]
 
-        # Update Front-End
-        await self.broadcast_private(game)
+        # Save
+        await game.asave(update_fields=["deck"])
 
  
 
@@ -1537,7 +1764,7 @@ class GameConsumer(AsyncWebsocketConsumer):
 
         This function is typically used when a game ends and a player has won.
         It adds the player's remaining chips in the game to their profile's chip count,
-        resets their in-game chip count to 0, saves both objects, and broadcasts a win message.
+        broadcasts a win message, and resets their in-game chip count to 0.
 
         Args:
             player (Player): The player whose chips are being transferred.
@@ -1546,18 +1773,13 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        # Fetch user profile
-        user = await sync_to_async(lambda: player.user, thread_sensitive=True)()
-        user_profile = await sync_to_async(
-            lambda: user.profile, thread_sensitive=True
-        )()
-
-        # Transfer chips
-        user_profile.chips += player.chips  # Add game chips to total chips
+        # Transfer chips: add game chips to total chips in a single UPDATE,
+        # so a concurrent change to the profile isn't overwritten
+        await Profile.objects.filter(user_id=player.user_id).aupdate(
+            chips=F("chips") + player.chips
+        )
 
-        username = await sync_to_async(
-            lambda: player.user.username, thread_sensitive=True
-        )()
+        username = player.user.username
         await self.broadcast_messages(
             f"🎉 {username} wins the game and receives {player.chips} chips!"
         )
@@ -1565,8 +1787,7 @@ class GameConsumer(AsyncWebsocketConsumer):
         player.chips = 0  # Reset game chips
 
         # Save changes
-        await sync_to_async(user_profile.save)()
-        await sync_to_async(player.save)()
+        await player.asave(update_fields=["chips"])
 
     #
     #
@@ -1583,9 +1804,10 @@ class GameConsumer(AsyncWebsocketConsumer):
 
     async def broadcast_messages(self, message: str) -> None:
         """
-        Stores (in Redis) and broadcasts only the *newly added* message to all players.
+        Stores (in Redis) and queues only the *newly added* message for all players.
 
-        Keeps the last 10 messages in Redis, but clients only receive this most recent one.
+        Keeps the last 10 messages in Redis. The message is sent with the next
+        game state broadcast, or by flush_messages at the end of receive.
 
         Args:
             message (str): The message to store and broadcast.
@@ -1594,79 +1816,215 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        # Store the message in Redis (pushing to the end of the list)
-        redis_key = f"game_{self.game_id}_messages"
-        redis_client.rpush(redis_key, json.dumps({"message": message}))
-        # Trim to last 10
-        redis_client.ltrim(redis_key, -10, -1)
+        self.store_message_in_background(message)
+        self.pending_messages.append(message)
+
+    # -----------------------------------------------------------------------
+    async def flush_messages(self) -> None:
+        """
+        Broadcasts the queued messages to all players in a single frame.
+
+        Returns:
+            None
+        """
+
+        if not self.pending_messages:
+            return
 
-        # Broadcast *only* the newly-added message
+        messages, self.pending_messages = self.pending_messages, []
+
+        # Serialized once for all players
         await self.channel_layer.group_send(
             self.room_group_name,
             {
-                "type": "broadcast_messages_helper",
-                "messages": [message], 
+                "type": "broadcast_text_helper",
+                "text": orjson.dumps({"messages": messages}).decode(),
             },
         )
 
-    async def broadcast_messages_helper(self, event):
+    def store_message_in_background(self, message: str) -> None:
         """
-        Sends action messages to the frontend.
+        Stores a message in Redis without holding up the broadcast.
+
+        Keeps a reference to the task until it completes so it is not
+        garbage collected mid-write.
+
+        Args:
+            message (str): The message to store.
+
+        Returns:
+            None
+        """
+
+        task = asyncio.create_task(self.store_message(message))
+        background_tasks.add(task)
+        task.add_done_callback(finish_background_task)
+
+    async def store_message(self, message: str) -> None:
+        """
+        Stores a message in Redis, keeping only the last 10 for the room.
+
+        Args:
+            message (str): The message to store.
+
+        Returns:
+            None
+        """
+
+        redis_key = f"game_{self.game_id}_messages"
+
+        # Holding the lock keeps it in message_locks until this write is done
+        lock = message_locks.get(redis_key)
+        if lock is None:
+            lock = message_locks[redis_key] = asyncio.Lock()
+
+        # Push to the end of the list and trim to last 10, in a single round trip
+        async with lock:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.rpush(redis_key, message)
+                pipe.ltrim(redis_key, -10, -1)
+                await pipe.execute()
+
+    async def broadcast_text_helper(self, event):
+        """
+        Sends an already serialized payload to the frontend.
  
-        This is triggered by the `broadcast_messages` method to deliver the list of
-        recent game messages to the client.
+        Used for group broadcasts (messages, game state), so the payload is
+        encoded once by the sender rather than once per connected player.
  
+        The payload is queued; flush_outbox sends it, merged with any other
+        broadcast that arrives in the meantime.
+
         Args:
-            event (dict): Contains the list of messages to send.
+            event (dict): Contains the JSON text to send.
  
         Returns:
             None
         """
-        message_data = {
-            "messages": event["messages"],
-        }
-        await self.send(text_data=json.dumps(message_data))
+        # Ignore broadcasts to a connection that was refused in connect()
+        if self.outbox is None:
+            return
+        self.outbox.put_nowait((event["text"], False))
 
 
     # -----------------------------------------------------------------------
-    async def broadcast_game_state(self, game:Game) -> None:
+    async def flush_outbox(self) -> None:
+        """
+        Sends queued group broadcasts to the frontend, batching bursts.
+
+        The first payload after an idle period is sent right away. Anything
+        queued while it was being sent, or during the short window after it,
+        is drained and sent in order, with runs of public broadcasts merged
+        into one frame (see coalesce_frames). If a send fails, the connection
+        is closed.
+
+        Returns:
+            None
+        """
+        while True:
+            batch = [await self.outbox.get()]
+            while len(batch) < BROADCAST_BATCH_MAX:
+                try:
+                    batch.append(self.outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                for text in coalesce_frames(batch):
+                    await self.send(text_data=text)
+            except Exception:
+                # Without this task the client would never get another frame,
+                # so log the failure and drop the connection instead
+                logger.exception("Failed to send to %s. Closing connection.", self.channel_name)
+                self.outbox = None
+                await self.close()
+                return
+
+            # Let a burst accumulate before the next send
+            await asyncio.sleep(BROADCAST_BATCH_WINDOW)
+
+
+    # -----------------------------------------------------------------------
+    async def broadcast_game_state(self, game:Game, message: str = None, private: bool = False) -> None:
         """
         Sends the complete game state to all connected players.
  
         Constructs and sends a detailed game state payload including each player's status,
         current phase, pot size, community cards, and the player whose turn it is.
+        An optional message, and any messages queued by broadcast_messages,
+        are sent in the same frame instead of separate broadcasts.
  
         Args:
             game (Game): The current game instance.
+            message (str, optional): A message to broadcast along with the state.
+            private (bool, optional): Also send each player their private state
+                (like broadcast_private), from the same player query.
  
         Returns:
             None
         """
 
-        # Fetch all players asynchronously
-        players = await sync_to_async(
-            lambda: list(game.players.all()), thread_sensitive=True
-        )()
+        # Build the whole payload in a single thread hop
+        game_state_message, players = await self.get_game_state(game)
+
+        # Carry the queued messages (and this one) in the same frame
+        if message:
+            self.store_message_in_background(message)
+            self.pending_messages.append(message)
+
+        if self.pending_messages:
+            game_state_message["messages"], self.pending_messages = self.pending_messages, []
+
+        # Send this game state to all players, serialized once
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "broadcast_text_helper",
+                "text": orjson.dumps(game_state_message).decode(),
+            },
+        )
+
+        # Private states go out after the room's, so each client gets the new
+        # public state (e.g. a new hand) before its own hole cards
+        if private:
+            await self.send_private_states(players)
+
+
+    # -----------------------------------------------------------------------
+    @sync_to_async
+    def get_game_state(self, game: Game) -> tuple[dict, list]:
+        """
+        Builds the public game state payload.
+
+        Runs synchronously so that every database access happens in one
+        thread hop: players, users and profiles are loaded in a single query
+        and everything else is derived from those rows.
+
+        Args:
+            game (Game): The current game instance.
+
+        Returns:
+            tuple[dict, list]: The game state message, and the players (with
+            users and profiles) it was built from.
+        """
+
+        players = list(
+            game.players.select_related("user__profile").order_by("position")
+        )
 
-        
         # Find the current player in the list
         current_player = next(
             (p for p in players if p.position == game.current_turn),
             players[0] if players else None
         )
 
-        current_username = (
-            await sync_to_async(
-                lambda: current_player.user.username, thread_sensitive=True
-            )()
-            if current_player
-            else ""
-        )
+        current_username = current_player.user.username if current_player else ""
 
-        # Get the current pot amount
-        pot = await sync_to_async(lambda: game.get_pot(), thread_sensitive=True)()
+        # Same as game.get_pot() and the highest bet used by
+        # can_user_do_action(), without querying the players again
+        pot = sum(p.total_bet for p in players)
+        highest_bet = max((p.current_bet for p in players), default=0)
 
-        # Create a personal game state message for each player
         game_state_message = {
             "type": "update_game_state",
             "game_status": game.status,
@@ -1678,12 +2036,8 @@ class GameConsumer(AsyncWebsocketConsumer):
             "community_cards": game.community_cards,
             "players": [
                 {
-                    "username": await sync_to_async(
-                        lambda: p.user.username, thread_sensitive=True
-                    )(),
-                    "avatar_color": await sync_to_async(
-                        lambda: p.user.profile.avatar_color, thread_sensitive=True
-                    )(),
+                    "username": p.user.username,
+                    "avatar_color": p.user.profile.avatar_color,
                     "position": p.position,
                     "game_chips": p.chips,
                     "current_bet": p.current_bet,
@@ -1696,33 +2050,45 @@ class GameConsumer(AsyncWebsocketConsumer):
                     "is_dealer": p.is_dealer,
                     "is_all_in": p.is_all_in,
                     "is_next_to_play": p.position == current_player.position,
-                    "user_can_check": await sync_to_async(
-                       lambda: can_user_do_action(game, p, "check"), thread_sensitive=True
-                    )(),
-                    "user_can_call": await sync_to_async(
-                       lambda: can_user_do_action(game, p, "call"), thread_sensitive=True
-                    )(),
+                    "user_can_check": can_user_do_action(game, p, "check", highest_bet),
+                    "user_can_call": can_user_do_action(game, p, "call", highest_bet),
                 }
                 for p in players
             ],
         }
 
-        # Send this game state **privately** to the respective player
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                "type": "broadcast_send_helper",
-                "data": game_state_message,
-            },
-        )
+        return game_state_message, players
+
 
-   
     # -----------------------------------------------------------------------
     async def broadcast_send_helper(self, event):
         """
-        Trigger that handles sending data.
+        Trigger that handles sending private data, already serialized by the
+        sender. Queued in the same outbox as the room's broadcasts, so it
+        keeps its place after them, but it is never merged with them.
+        """
+        if self.outbox is None:
+            return
+        self.outbox.put_nowait((event["text"], True))
+
+
+    # -----------------------------------------------------------------------
+    def send_error(self, text: str) -> None:
+        """
+        Sends an error frame to this client only.
+
+        Queued in the outbox like any other frame, so it cannot overtake
+        broadcasts that are still waiting to be sent.
+
+        Args:
+            text (str): The serialized error payload.
+
+        Returns:
+            None
         """
-        await self.send(text_data=json.dumps(event["data"]))
+        if self.outbox is None:
+            return
+        self.outbox.put_nowait((text, True))
 
 
     # -----------------------------------------------------------------------
@@ -1740,35 +2106,43 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        # Fetch all players asynchronously
+        # Fetch all players with their user profile asynchronously
         players = await sync_to_async(
-            lambda: list(game.players.all()), thread_sensitive=True
+            lambda: list(game.players.select_related("user__profile")),
+            thread_sensitive=True,
         )()
 
-        for player in players:
-            id = await sync_to_async(lambda: player.user.id, thread_sensitive=True)()
-            hole_cards = await sync_to_async(
-                lambda: player.hole_cards, thread_sensitive=True
-            )()
-            total_user_chips = await sync_to_async(
-                lambda: player.user.profile.chips, thread_sensitive=True
-            )()
+        await self.send_private_states(players)
 
-            # Create a personal game state message for each player
-            private_data = {
-                "type": "update_private",
-                "hole_cards": hole_cards,
-                "total_user_chips": total_user_chips,
-            }
 
-            # Send this game state **privately** to the respective player
-            await self.channel_layer.group_send(
-                f"user_{id}",
+    # -----------------------------------------------------------------------
+    async def send_private_states(self, players: list) -> None:
+        """
+        Sends each player their private game state (hole cards and total chips).
+
+        Args:
+            players (list): The players, loaded with their user profiles.
+
+        Returns:
+            None
+        """
+
+        # Send each personal game state **privately** to the respective player,
+        # all at once rather than one round trip after another
+        await asyncio.gather(*(
+            self.channel_layer.group_send(
+                f"user_{player.user_id}",
                 {
                     "type": "broadcast_send_helper",
-                    "data": private_data,
+                    "text": orjson.dumps({
+                        "type": "update_private",
+                        "hole_cards": player.hole_cards,
+                        "total_user_chips": player.user.profile.chips,
+                    }).decode(),
                 },
             )
+            for player in players
+        ))
 
 
     # -----------------------------------------------------------------------
@@ -1784,14 +2158,12 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """
 
-        player = await sync_to_async(lambda: game.players.filter(user=user).first())()
+        player = await game.players.select_related("user__profile").filter(user=user).afirst()
         if not player:
             return  # Safety check
 
         hole_cards = player.hole_cards 
-        total_user_chips = await sync_to_async(
-            lambda: player.user.profile.chips, thread_sensitive=True
-        )()
+        total_user_chips = player.user.profile.chips
 
         private_message = {
             "type": "private_game_state",
@@ -1804,7 +2176,7 @@ class GameConsumer(AsyncWebsocketConsumer):
             self.user_channel_name,  # Only to the current user
             {
                 "type": "broadcast_send_helper",
-                "data": private_message,
+                "text": orjson.dumps(private_message).decode(),
             },
         )
 
@@ -1821,9 +2193,9 @@ class GameConsumer(AsyncWebsocketConsumer):
             None
         """ 
 
-        total_user_chips = await sync_to_async(
-            lambda: user.profile.chips, thread_sensitive=True
-        )()
+        # Read the chips directly: user.profile would stay cached on the
+        # connection's user and go stale after the first access
+        total_user_chips = await Profile.objects.values_list("chips", flat=True).aget(user=user)
 
         private_message = {
             "type": "private_game_state",
@@ -1835,6 +2207,6 @@ class GameConsumer(AsyncWebsocketConsumer):
             self.user_channel_name,  # Only to the current user
             {
                 "type": "broadcast_send_helper",
-                "data": private_message,
+                "text": orjson.dumps(private_message).decode(),
             },
         )
@@ -12,20 +12,13 @@ pieces of data are stored. This allows the application to store and manage
 players, games, and poker statistics seamlessly.
 """
 
-import redis
 from django.db import models
+from django.db.models import Max
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.timezone import now
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
-from django.conf import settings
-
-
-# Connect to Redis
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True
-)
 
 
 class Profile(models.Model):
@@ -182,6 +175,12 @@ class Game(models.Model):
         """
         players = list(self.players.order_by("position"))
         return sum(player.total_bet for player in players)
+
+    def get_highest_bet(self) -> int:
+        """
+        Returns the highest current bet among all players, computed by the database.
+        """
+        return self.players.aggregate(highest_bet=Max("current_bet"))["highest_bet"] or 0
        
     def burn_card(self) -> None:
         """
@@ -196,8 +195,7 @@ class Game(models.Model):
         Returns:
             None
         """
-        if self.deck:
-            self.deck.pop(0)
+        self.deck = self.deck[1:]
     
 
     def __str__(self):
@@ -1,3 +1,232 @@
-from django.test import TestCase
+import asyncio
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+import orjson
+from asgiref.sync import async_to_sync, sync_to_async
+
+from .consumers import GameConsumer, coalesce_frames, merge_frames
+from .models import Game, Player
+from .utils import decode_stored_message
+
+
+# -----------------------------------------------------------------------
+class DecodeStoredMessageTests(SimpleTestCase):
+    """
+    Messages in Redis are plain strings, but older lists hold JSON entries.
+    """
+
+    def test_plain_string_is_returned_as_is(self):
+        self.assertEqual(decode_stored_message("🔵 u1 checked."), "🔵 u1 checked.")
+
+    def test_legacy_json_entry_is_unwrapped(self):
+        entry = '{"message": "\\ud83d\\udfe2 u0 called 100 chips."}'
+        self.assertEqual(decode_stored_message(entry), "🟢 u0 called 100 chips.")
+
+    def test_text_that_is_not_a_legacy_entry_is_kept(self):
+        self.assertEqual(decode_stored_message("{not json"), "{not json")
+        self.assertEqual(decode_stored_message('{"other": 1}'), '{"other": 1}')
+
+
+# -----------------------------------------------------------------------
+def frame(**data) -> str:
+    """Serializes a payload the way the consumer queues it."""
+    return orjson.dumps(data).decode()
+
+
+# -----------------------------------------------------------------------
+class MergeFramesTests(SimpleTestCase):
+    """
+    Group broadcasts queued together are merged into a single frame.
+    """
+
+    def test_messages_are_concatenated_in_order(self):
+        merged = orjson.loads(merge_frames([
+            frame(messages=["a"]),
+            frame(messages=["b", "c"]),
+        ]))
+        self.assertEqual(merged, {"messages": ["a", "b", "c"]})
+
+    def test_latest_state_wins(self):
+        merged = orjson.loads(merge_frames([
+            frame(type="update_game_state", pot=100, players=[{"username": "u0"}]),
+            frame(messages=["u1 called."]),
+            frame(type="update_game_state", pot=200, players=[{"username": "u1"}]),
+        ]))
+        self.assertEqual(merged, {
+            "type": "update_game_state",
+            "pot": 200,
+            "players": [{"username": "u1"}],
+            "messages": ["u1 called."],
+        })
+
+    def test_state_keys_missing_from_a_later_frame_are_kept(self):
+        merged = orjson.loads(merge_frames([
+            frame(type="update_game_state", pot=100, messages=["a"]),
+            frame(messages=["b"]),
+        ]))
+        self.assertEqual(merged, {"type": "update_game_state", "pot": 100, "messages": ["a", "b"]})
+
+    def test_no_messages_key_without_messages(self):
+        merged = orjson.loads(merge_frames([frame(pot=1), frame(pot=2)]))
+        self.assertEqual(merged, {"pot": 2})
+
+
+# -----------------------------------------------------------------------
+class CoalesceFramesTests(SimpleTestCase):
+    """
+    A batch from the outbox is sent in order, merging only public runs.
+    """
+
+    def test_single_frame_is_sent_unchanged(self):
+        text = frame(pot=1)
+        self.assertEqual(coalesce_frames([(text, False)]), [text])
+
+    def test_public_run_is_merged(self):
+        out = coalesce_frames([(frame(messages=["a"]), False), (frame(pot=5), False)])
+        self.assertEqual([orjson.loads(t) for t in out], [{"pot": 5, "messages": ["a"]}])
+
+    def test_private_frame_keeps_its_place(self):
+        state = frame(type="update_game_state", pot=150)
+        private = frame(type="update_private", hole_cards=["As", "Kd"])
+        later = frame(messages=["u0 called."])
+        self.assertEqual(
+            coalesce_frames([(state, False), (private, True), (later, False)]),
+            [state, private, later],
+        )
+
+    def test_private_frames_are_never_merged(self):
+        first = frame(type="update_private", total_user_chips=1)
+        second = frame(type="update_private", total_user_chips=2)
+        self.assertEqual(coalesce_frames([(first, True), (second, True)]), [first, second])
+
+
+# -----------------------------------------------------------------------
+class OutboxTests(SimpleTestCase):
+    """
+    Every frame to a client goes through its outbox, in order.
+    """
+
+    def consumer(self):
+        """Builds a consumer with an outbox and a recorded send()."""
+        consumer = GameConsumer()
+        consumer.channel_name = "test"
+        consumer.outbox = asyncio.Queue()
+        consumer.sent = []
+
+        async def send(text_data):
+            consumer.sent.append(text_data)
+        consumer.send = send
+        return consumer
+
+    async def test_error_does_not_overtake_queued_broadcasts(self):
+        consumer = self.consumer()
+        state = frame(type="update_game_state", pot=150)
+        await consumer.broadcast_text_helper({"text": state})
+        consumer.send_error(frame(error="Cannot check"))
+
+        task = asyncio.create_task(consumer.flush_outbox())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        self.assertEqual(consumer.sent, [state, frame(error="Cannot check")])
+
+    async def test_failed_send_is_logged_and_closes_the_connection(self):
+        consumer = self.consumer()
+        consumer.send = mock.AsyncMock(side_effect=RuntimeError("socket gone"))
+        consumer.close = mock.AsyncMock()
+        consumer.send_error(frame(error="Cannot check"))
+
+        with self.assertLogs("game.consumers", level="ERROR"):
+            await asyncio.wait_for(consumer.flush_outbox(), timeout=1)
+
+        consumer.close.assert_awaited_once()
+        self.assertIsNone(consumer.outbox)
+        consumer.send_error(frame(error="Cannot check"))  # dropped, not queued
+
+
+# -----------------------------------------------------------------------
+class ShowdownPayoutTests(TestCase):
+    """
+    handle_showdown splits every (side) pot between its best hands and pays
+    all winners in one write.
+    """
+
+    def seat(self, game, username, position, hole_cards, total_bet, has_folded=False):
+        """Seats a player with 1000 chips, cards and a total bet for the hand."""
+        user = User.objects.create_user(username, password="x")
+        return Player.objects.create(
+            game=game, user=user, position=position, chips=1000,
+            hole_cards=hole_cards, total_bet=total_bet, has_folded=has_folded,
+        )
+
+    async def showdown(self, game):
+        """Runs handle_showdown and returns the messages it broadcast."""
+        consumer = GameConsumer()
+        consumer.game_id = game.id
+        consumer.pending_messages = []
+        with mock.patch.object(GameConsumer, "store_message_in_background"):
+            await consumer.handle_showdown(game)
+        return consumer.pending_messages
+
+    async def test_split_pot_is_shared_equally(self):
+        game = await Game.objects.acreate(
+            name="split", community_cards=["Ts", "Jh", "Qd", "Kc", "Ad"]
+        )
+        a = await sync_to_async(self.seat)(game, "a", 0, ["2c", "3d"], 100)
+        b = await sync_to_async(self.seat)(game, "b", 1, ["4c", "5d"], 100)
+
+        messages = await self.showdown(game)
+
+        await a.arefresh_from_db()
+        await b.arefresh_from_db()
+        self.assertEqual((a.chips, b.chips), (1100, 1100))
+        self.assertEqual(len(messages), 2)
+        self.assertTrue(all("wins 100" in m and "(Straight)" in m for m in messages))
+
+    async def test_side_pots_pay_each_winner_with_their_own_hand(self):
+        game = await Game.objects.acreate(
+            name="side", community_cards=["2c", "7d", "9h", "Js", "3c"]
+        )
+        # Short all-in with the best hand, a folded contribution, and two
+        # players contesting the side pot
+        a = await sync_to_async(self.seat)(game, "a", 0, ["2h", "2d"], 50)
+        b = await sync_to_async(self.seat)(game, "b", 1, ["Kh", "Kd"], 200)
+        c = await sync_to_async(self.seat)(game, "c", 2, ["5h", "6d"], 200)
+        d = await sync_to_async(self.seat)(game, "d", 3, ["8h", "8d"], 20, has_folded=True)
+
+        messages = await self.showdown(game)
+
+        for player in (a, b, c, d):
+            await player.arefresh_from_db()
+        # a: 20*4 + 30*3 from the main pots; b: 150*2 from the side pot
+        self.assertEqual(
+            (a.chips, b.chips, c.chips, d.chips), (1170, 1300, 1000, 1000)
+        )
+        self.assertEqual(len(messages), 2)
+        self.assertIn("a wins 170", messages[0])
+        self.assertIn("(Three of a Kind)", messages[0])
+        self.assertIn("b wins 300", messages[1])
+        self.assertIn("(Pair)", messages[1])
+
+
+# -----------------------------------------------------------------------
+class LeaveGameTransactionTests(TestCase):
+    """
+    Leaving renumbers the remaining seats without touching anything else.
+    """
+
+    def test_remaining_players_are_renumbered(self):
+        game = Game.objects.create(name="leave", status="active", dealer_position=2)
+        for position, username in enumerate(["a", "b", "c"]):
+            Player.objects.create(
+                game=game, position=position, chips=500 + position,
+                user=User.objects.create_user(username, password="x"),
+            )
+
+        async_to_sync(GameConsumer().leave_game_transaction)(game.id, "b")
+
+        seats = list(game.players.order_by("position").values_list("user__username", "position", "chips"))
+        self.assertEqual(seats, [("a", 0, 500), ("c", 1, 502)])
@@ -5,6 +5,7 @@ utils.py
 Defines the helper functions.
 
 """
+import json
 from treys import Evaluator, Card
 from typing import List, Tuple
 from itertools import combinations
@@ -12,24 +13,64 @@ from .models import Game, Player
 
 
 
+# The 52 cards in treys notation, built once at import
+SUITS = ["s", "c", "h", "d"]  # ["♠", "♣", "♥", "♦"]
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
+DECK = tuple(f"{rank}{suit}" for suit in SUITS for rank in RANKS)
+
+
 # -----------------------------------------------------------------------
 def create_deck () -> list:
     """
+    Returns a new, unshuffled list of the 52 cards.
     """
-    suits = ["s", "c", "h", "d"]  # ["♠", "♣", "♥", "♦"]
-    ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
-    return [f"{rank}{suit}" for suit in suits for rank in ranks]
+    return list(DECK)
 
 
 # -----------------------------------------------------------------------
-def can_user_do_action(game: Game, player: Player, action: str) -> bool:
+def decode_stored_message(entry: str) -> str:
     """
-    
+    Returns the text of a message stored in Redis.
+
+    Messages are stored as plain strings, but lists written by older versions
+    still hold {"message": ...} JSON entries until they are trimmed away.
+
+    Args:
+        entry (str): A raw entry from the room's message list.
+
+    Returns:
+        str: The message text.
+    """
+    if entry.startswith("{"):
+        try:
+            data = json.loads(entry)
+        except ValueError:
+            return entry
+        if isinstance(data, dict) and "message" in data:
+            return data["message"]
+    return entry
+
+
+# -----------------------------------------------------------------------
+def can_user_do_action(game: Game, player: Player, action: str, highest_bet: int = None) -> bool:
+    """
+    Checks whether the player can check or call.
+
+    Args:
+        game (Game): The current game instance.
+        player (Player): The player about to act.
+        action (str): "check" or "call".
+        highest_bet (int, optional): Highest current bet at the table, when already
+            known. Queried from the database otherwise.
+
+    Returns:
+        bool: True if the action is allowed.
     """
     if player.is_all_in or player.has_folded:
         return False
 
-    highest_bet = max(game.players.values_list("current_bet", flat=True))
+    if highest_bet is None:
+        highest_bet = game.get_highest_bet()
     difference = highest_bet - player.current_bet
 
     if action == "check" and difference > 0 :
@@ -16,10 +16,16 @@ from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib import messages
+from django.db.models import Count
 
 from .forms import ProfileForm
 from .models import Game
-from .utils import can_user_do_action
+from .utils import can_user_do_action, decode_stored_message
+
+# Connect to Redis (module-level, so requests share one connection pool)
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True
+)
 
 
 @login_required
@@ -51,7 +57,8 @@ def dashboard(request):
     Returns:
         HttpResponse: Rendered dashboard template with available games.
     """
-    available_games = Game.objects.all
+    # Seated player count for each table, in the same query
+    available_games = Game.objects.annotate(player_count=Count("players"))
     return render(
         request,
         "game/dashboard.html",
@@ -146,23 +153,21 @@ def table(request, game_id):
         HttpResponse: Rendered table view with game and player info.
     """
 
-    # Connect to Redis
-    redis_client = redis.Redis(
-        host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True
-    )
-
     game = get_object_or_404(Game, id=game_id)
-    players = game.players.all()
+    players = game.players.select_related("user__profile")
     current_turn_player = players.filter(position=game.current_turn).first() or players.first()
     current_turn_username = current_turn_player.user.username if current_turn_player else ""
     is_player = players.filter(user=request.user).exists()
 
     # Retrieve last 10 messages from Redis (or DB)
     redis_key = f"game_{game_id}_messages"
-    stored_messages = redis_client.lrange(redis_key, -10, -1)  # list of JSON strings
-    # parse each
-    clean_messages = [json.loads(msg).get("message", "") for msg in stored_messages]
+    clean_messages = [
+        decode_stored_message(entry) for entry in redis_client.lrange(redis_key, -10, -1)
+    ]
+
 
+    # Highest bet at the table, queried once for every player's check/call
+    highest_bet = game.get_highest_bet()
 
     players_data = []
 
@@ -178,8 +183,8 @@ def table(request, game_id):
             "avatar_color": p.user.profile.avatar_color,
             "current_bet": p.current_bet,
             "is_next_to_play": p.position == current_turn_player.position,
-            "user_can_check": can_user_do_action(game, p, "check"),
-            "user_can_call": can_user_do_action(game, p, "call"),
+            "user_can_check": can_user_do_action(game, p, "check", highest_bet),
+            "user_can_call": can_user_do_action(game, p, "call", highest_bet),
         })
 
     players_json = json.dumps(players_data)
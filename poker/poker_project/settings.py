@@ -153,6 +153,22 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Logging: the game's debug trace (turns, phases, bets) is only emitted in DEBUG,
+# so production doesn't pay for formatting and writing it on every action.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "game": {
+            "handlers": ["console"],
+            "level": "DEBUG" if DEBUG else "INFO",
+        },
+    },
+}
+
 
 # Tailwind CSS config
 TAILWIND_APP_NAME = 'theme'